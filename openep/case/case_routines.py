@@ -65,6 +65,7 @@ from attr import attrs
 
 import numpy as np
 import scipy.interpolate
+import scipy.spatial
 
 __all__ = [
     'get_mapping_points_within_woi',
@@ -275,7 +276,9 @@ def get_sample_indices_within_woi(case, buffer=50, indices=None):
         woi = case.electric.annotations.window_of_interest[indices]
         ref_annotations = case.electric.annotations.reference_activation_time[indices, np.newaxis]
 
-    sample_indices = np.full_like(egm, fill_value=np.arange(egm.shape[1]), dtype=int)
+    # The sample indices are the same for every electrogram - broadcast a single row
+    # rather than creating an array the size of `egm`
+    sample_indices = np.arange(egm.shape[1])[np.newaxis, :]
     start_time, stop_time = (woi + ref_annotations + [-buffer, buffer]).T
 
     within_woi = np.logical_and(
@@ -321,7 +324,7 @@ def calculate_voltage_from_electrograms(case, buffer=50, bipolar=True, indices=N
     return amplitudes
 
 
-def calculate_distance(origin, destination):
+def calculate_distance(origin, destination, squared=False):
     """
     Returns the distance from a set of origin points to a set of destination
     points.
@@ -329,6 +332,9 @@ def calculate_distance(origin, destination):
     Args:
         origin (ndarray): Nx3 matrix of coordinates
         destination (ndarray): Mx3 matrix of coordinates
+        squared (bool, optional): If True, the squared distances will be returned. This
+            avoids taking the square root, and is useful if the distances are only
+            going to be compared to a threshold. The default is False.
 
     Returns:
         distances (ndarray): MxN matrix of distances
@@ -341,6 +347,7 @@ def calculate_distance(origin, destination):
     distances = scipy.spatial.distance.cdist(
         origin,
         destination,
+        metric='sqeuclidean' if squared else 'euclidean',
     )
 
     return distances
@@ -369,10 +376,13 @@ def calculate_points_within_distance(origin, destination, max_distance, return_d
     origin = origin[np.newaxis, :] if origin.ndim == 1 else origin
     destination = destination[np.newaxis, :] if destination.ndim == 1 else destination
 
-    distances = calculate_distance(origin, destination)
-    within_max_distance = distances <= max_distance
+    # Compare squared distances so the square root is only taken if the distances are returned
+    squared_distances = calculate_distance(origin, destination, squared=True)
+    max_distance_squared = max_distance ** 2 if max_distance >= 0 else -np.inf
+    within_max_distance = squared_distances <= max_distance_squared
 
     if return_distances:
+        distances = np.sqrt(squared_distances, out=squared_distances)
         return within_max_distance, distances
 
     return within_max_distance
@@ -422,6 +432,10 @@ class Interpolator:
             **self.method_kws,
         )
 
+        # KD-tree of the data points, created on first use of `max_distance`
+        # and reused for subsequent calls
+        self._tree = None
+
     def __call__(self, surface_points, max_distance=None):
         """Interpolate the scalar field onto a new set of coordinates
 
@@ -439,13 +453,18 @@ class Interpolator:
         interpolated_field = self.interpolate(surface_points)
 
         if max_distance is not None:
-            within_distance = calculate_points_within_distance(
+            if self._tree is None:
+                self._tree = scipy.spatial.cKDTree(self.points)
+
+            # Count the original points within max_distance of each surface point rather
+            # than building the full (M, N) distance matrix
+            n_within_distance = self._tree.query_ball_point(
                 surface_points,
-                self.points,
-                max_distance=max_distance,
-                return_distances=False
+                r=max_distance,
+                return_length=True,
+                workers=-1,
             )
-            within_distance = np.any(within_distance, axis=1)
+            within_distance = n_within_distance > 0
             interpolated_field[~within_distance] = np.NaN
 
         return interpolated_field
@@ -503,7 +522,8 @@ def interpolate_activation_time_onto_surface(
 
     # Any points that are not part of the mesh faces should have bipolar voltage set to NaN
     n_surface_points = surface_points.shape[0]
-    not_on_surface = ~np.in1d(np.arange(n_surface_points), case.indices)
+    not_on_surface = np.ones(n_surface_points, dtype=bool)
+    not_on_surface[case.indices.ravel()] = False
     interpolated_lat[not_on_surface] = np.NaN
 
     return interpolated_lat
@@ -564,7 +584,8 @@ def interpolate_voltage_onto_surface(
 
     # Any points that are not part of the mesh faces should have bipolar voltage set to NaN
     n_surface_points = surface_points.shape[0]
-    not_on_surface = ~np.in1d(np.arange(n_surface_points), case.indices)
+    not_on_surface = np.ones(n_surface_points, dtype=bool)
+    not_on_surface[case.indices.ravel()] = False
     interpolated_voltages[not_on_surface] = np.NaN
 
     return interpolated_voltages
@@ -26,8 +26,7 @@ This module provides classes for performing interpolation.
 from attr import attrs
 
 import numpy as np
-import numba
-from .case_routines import calculate_distance
+import scipy.spatial
 
 __all__ = [
     'LocalSmoothingInterpolator',
@@ -66,38 +65,34 @@ class LocalSMoothingInterpolator:
         n_points = len(new_points)
         new_field = np.full(n_points, fill_value=self.fill_value, dtype=float)
 
-        distances = calculate_distance(
-            origin=new_points,
-            destination=self.points,
+        # No point can be strictly within a non-positive smoothing length
+        if self.smoothing_length <= 0:
+            return new_field
+
+        # Find only the pairs of points that are within the smoothing length of one another,
+        # rather than calculating the distance between every pair of points
+        new_points_tree = scipy.spatial.cKDTree(new_points)
+        points_tree = scipy.spatial.cKDTree(self.points)
+        pairs = new_points_tree.sparse_distance_matrix(
+            points_tree,
+            max_distance=self.smoothing_length,
+            output_type='ndarray',
         )
 
-        new_field = _local_smoothing(
-            field=self.field,
-            smoothing_length=self.smoothing_length,
-            distances=distances,
-            out=new_field,
+        # sparse_distance_matrix includes pairs exactly at the cutoff distance
+        pairs = pairs[pairs['v'] < self.smoothing_length]
+        new_point_indices, point_indices, distances = pairs['i'], pairs['j'], pairs['v']
+
+        # Calculate the field at each new point as the weighted average of nearby points
+        weights = np.exp(-(distances / self.smoothing_length)**2)
+        total_weights = np.bincount(new_point_indices, weights=weights, minlength=n_points)
+        weighted_field = np.bincount(
+            new_point_indices,
+            weights=weights * self.field[point_indices],
+            minlength=n_points,
         )
 
-        return new_field
-
-
-@numba.jit(nopython=True, cache=True, fastmath=True)
-def _local_smoothing(field, smoothing_length, distances, out):
-
-    within_cutoff = distances < smoothing_length
-
-    for index in range(out.shape[0]):
+        within_cutoff = total_weights > 0
+        new_field[within_cutoff] = weighted_field[within_cutoff] / total_weights[within_cutoff]
 
-        if not np.any(within_cutoff[index]):
-            continue
-
-        # Calculate field at new points
-        distance = distances[index]
-        exponent = distance[distance < smoothing_length] / smoothing_length
-        weights = np.exp(-exponent**2)
-        normalised_weights = weights / weights.sum()
-
-        field_value = sum(field[distance < smoothing_length] * normalised_weights)
-        out[index] = field_value
-
-    return out
+        return new_field
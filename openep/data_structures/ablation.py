@@ -24,39 +24,106 @@ import numpy as np
 __all__ = []
 
 
-@attrs(auto_attribs=True, auto_detect=True)
 class AblationForce:
     """Class for storing data on ablation force.
 
+    The data are stored in a single (N, 7) array, with columns for the times, force,
+    axial angle, lateral angle, and the x, y, and z coordinates of each site.
+
     Args:
         times (np.ndarray): array of shape N
         force (np.ndarray): array of shape N
         axial_angle (np.ndarray): array of shape N
         lateral_angle (np.ndarray): array of shape N
-        points (np.ndarray): array of shape Nx3
+        points (np.ndarray): array of shape Nx3. For a single site, an array of shape 3
+            is also accepted.
+
+    Attributes:
+        times, force, axial_angle, lateral_angle, points (np.ndarray): Views into the
+            underlying array. They are read-only properties: the attributes cannot be
+            reassigned, but the values can be modified in-place. All are None if no
+            data were given.
+        n_sites (int): Number of ablation sites (N). 0 if no data were given.
+
+    Note
+    ----
+    Either all or none of the arguments must be given.
 
     """
-    times: np.ndarray = None
-    force: np.ndarray = None
-    axial_angle: np.ndarray = None
-    lateral_angle: np.ndarray = None
-    points: np.ndarray = None
+
+    def __init__(
+        self,
+        times: np.ndarray = None,
+        force: np.ndarray = None,
+        axial_angle: np.ndarray = None,
+        lateral_angle: np.ndarray = None,
+        points: np.ndarray = None,
+    ):
+
+        data = [times, force, axial_angle, lateral_angle, points]
+
+        if all(values is None for values in data):
+            self._data = None
+            return
+
+        if any(values is None for values in data):
+            raise ValueError("Either all or none of times, force, axial_angle, lateral_angle and points must be given.")
+
+        n_sites = np.size(times)
+        points_shape = np.shape(points)
+        if points_shape != (n_sites, 3) and not (n_sites == 1 and points_shape == (3,)):
+            raise ValueError(f"points must have shape ({n_sites}, 3), but it has shape {points_shape}.")
+
+        self._data = np.empty((n_sites, 7), dtype=float)
+        self._data[:, 0] = np.ravel(times)
+        self._data[:, 1] = np.ravel(force)
+        self._data[:, 2] = np.ravel(axial_angle)
+        self._data[:, 3] = np.ravel(lateral_angle)
+        self._data[:, 4:] = np.reshape(points, (n_sites, 3))
+
+    @classmethod
+    def _from_data(cls, data):
+        """Create an AblationForce from an existing (N, 7) array, without copying it."""
+
+        ablation_force = cls.__new__(cls)
+        ablation_force._data = data
+
+        return ablation_force
+
+    @property
+    def times(self):
+        return self._data[:, 0] if self._data is not None else None
+
+    @property
+    def force(self):
+        return self._data[:, 1] if self._data is not None else None
+
+    @property
+    def axial_angle(self):
+        return self._data[:, 2] if self._data is not None else None
+
+    @property
+    def lateral_angle(self):
+        return self._data[:, 3] if self._data is not None else None
+
+    @property
+    def points(self):
+        return self._data[:, 4:] if self._data is not None else None
+
+    @property
+    def n_sites(self):
+        return self._data.shape[0] if self._data is not None else 0
 
     def __repr__(self):
-        return f"Ablation forces with {len(self.times)} sites."
+        return f"Ablation forces with {self.n_sites} sites."
 
     def copy(self):
         """Create a deep copy of AblationForce"""
 
-        ablation_force = AblationForce(
-            times=np.array(self.times) if self.times is not None else None,
-            force=np.array(self.force) if self.force is not None else None,
-            axial_angle=np.array(self.axial_angle) if self.axial_angle is not None else None,
-            lateral_angle=np.array(self.lateral_angle) if self.lateral_angle is not None else None,
-            points=np.array(self.points) if self.points is not None else None,
-        )
+        data = self._data.copy() if self._data is not None else None
+
+        return AblationForce._from_data(data)
 
-        return ablation_force
 
 @attrs(auto_attribs=True, auto_detect=True)
 class Ablation:
@@ -92,10 +159,10 @@ class Ablation:
         """Create a deep copy of Ablation"""
 
         ablation = Ablation(
-            times=np.array(self.times) if self.times is not None else None,
-            power=np.array(self.power) if self.power is not None else None,
-            impedance=np.array(self.impedance) if self.impedance is not None else None,
-            temperature=np.array(self.temperature) if self.temperature is not None else None,
+            times=self.times.copy() if self.times is not None else None,
+            power=self.power.copy() if self.power is not None else None,
+            impedance=self.impedance.copy() if self.impedance is not None else None,
+            temperature=self.temperature.copy() if self.temperature is not None else None,
             force=self.force.copy(),
         )
 
@@ -114,20 +181,26 @@ def extract_ablation_data(ablation_data):
             as well as the force applied.
     """
 
-    if isinstance(ablation_data, np.ndarray) or ablation_data['originaldata']['ablparams']['time'].size == 0:
+    if isinstance(ablation_data, np.ndarray):
+        return Ablation()
+
+    ablation_params = ablation_data['originaldata']['ablparams']
+    if ablation_params['time'].size == 0:
         return Ablation()
 
-    times = ablation_data['originaldata']['ablparams']['time'].astype(float)
-    power = ablation_data['originaldata']['ablparams']['power'].astype(float)
-    impedance = ablation_data['originaldata']['ablparams']['impedance'].astype(float)
-    temperature = ablation_data['originaldata']['ablparams']['distaltemp'].astype(float)
+    times = ablation_params['time'].astype(float)
+    power = ablation_params['power'].astype(float)
+    impedance = ablation_params['impedance'].astype(float)
+    temperature = ablation_params['distaltemp'].astype(float)
 
+    # AblationForce copies the data into a single float array, so no need to cast here
+    force_data = ablation_data['originaldata']['force']
     force = AblationForce(
-        times=ablation_data['originaldata']['force']['time'].astype(float),
-        force=ablation_data['originaldata']['force']['force'].astype(float),
-        axial_angle=ablation_data['originaldata']['force']['axialangle'].astype(float),
-        lateral_angle=ablation_data['originaldata']['force']['lateralangle'].astype(float),
-        points=ablation_data['originaldata']['force']['position'].astype(float),
+        times=force_data['time'],
+        force=force_data['force'],
+        axial_angle=force_data['axialangle'],
+        lateral_angle=force_data['lateralangle'],
+        points=force_data['position'],
     )
 
     ablation = Ablation(
@@ -154,7 +227,7 @@ def empty_ablation():
         force=np.array([], dtype=float),
         axial_angle=np.array([], dtype=float),
         lateral_angle=np.array([], dtype=float),
-        points=np.array([], dtype=float),
+        points=np.empty((0, 3), dtype=float),
     )
 
     ablation = Ablation(
@@ -75,20 +75,19 @@ Ablation data
 .. autoclass:: openep.data_structures.ablation.AblationForce
 """
 
+import hashlib
 from attr import attrs
 from typing import Optional, Tuple, List
 
 import numpy as np
+import scipy.spatial
 import scipy.stats
 import pyvista
 
 from .surface import Fields
 from .electric import Electric, Electrogram, Annotations, ElectricSurface
 from .ablation import Ablation
-from ..case.case_routines import (
-    bipolar_from_unipolar_surface_points,
-    calculate_distance,
-)
+from ..case.case_routines import bipolar_from_unipolar_surface_points
 
 __all__ = []
 
@@ -131,6 +130,11 @@ class Case:
         self.electric = electric
         self.notes = notes
 
+        # Surface mesh (with point normals) reused between calls that do not modify
+        # the points or indices. It is keyed on a checksum of their contents, so that
+        # in-place edits (e.g. via `get_surface_data`) also invalidate it.
+        self._mesh_cache = None
+
     def __repr__(self):
         return f"{self.name}( nodes: {self.points.shape} indices: {self.indices.shape} {self.fields} )"
 
@@ -236,12 +240,42 @@ class Case:
 
         # We also need to update the case.electric.surface data (nearest surface point and normals)
         # Create a mesh if one is not provided
-        mesh = self.create_mesh() if mesh is None else mesh
+        mesh = self._get_mesh_with_normals() if mesh is None else mesh
         if 'Normals' not in mesh.point_data:
             mesh.compute_normals(cell_normals=False, point_normals=True, inplace=True)
 
         self._create_electric_surface(mesh=mesh)
 
+    def _get_mesh_with_normals(self) -> pyvista.PolyData:
+        """Get a mesh, with point normals, of the case's points and indices.
+
+        The mesh is cached and only recreated if the points or indices have changed since
+        it was last created. It should therefore be treated as read-only.
+        """
+
+        checksum = self._surface_checksum()
+        if self._mesh_cache is not None:
+            cached_checksum, mesh = self._mesh_cache
+            if cached_checksum == checksum:
+                return mesh
+
+        mesh = self.create_mesh()
+        mesh.compute_normals(cell_normals=False, point_normals=True, inplace=True)
+        self._mesh_cache = (checksum, mesh)
+
+        return mesh
+
+    def _surface_checksum(self) -> bytes:
+        """Hash the contents of the points and indices."""
+
+        checksum = hashlib.blake2b(digest_size=16)
+        for array in (self.points, self.indices):
+            array = np.ascontiguousarray(array)
+            checksum.update(str((array.shape, array.dtype.str)).encode())
+            checksum.update(array.data)
+
+        return checksum.digest()
+
     def _create_electric_surface(self, mesh: pyvista.PolyData):
         """Add ElectricSurface data."""
 
@@ -249,12 +283,12 @@ class Case:
         if self.electric.bipolar_egm._points is None:
             return
 
-        surface_points = mesh.points
-        distance_to_surface = calculate_distance(
-            origin=self.electric.bipolar_egm._points,
-            destination=surface_points,
+        tree = scipy.spatial.cKDTree(mesh.points)
+        _, nearest_point_indices = tree.query(
+            self.electric.bipolar_egm._points,
+            k=1,
+            workers=-1,
         )
-        nearest_point_indices = np.argmin(distance_to_surface, axis=1)
 
         self.electric.surface = ElectricSurface(
             nearest_point=mesh.points[nearest_point_indices],
@@ -479,8 +513,7 @@ class Case:
             self.electric.bipolar_egm = bipolar_egm
 
             # Update electric surface data
-            mesh = self.create_mesh()
-            mesh.compute_normals(cell_normals=False, point_normals=True, inplace=True)
+            mesh = self._get_mesh_with_normals()
             self._create_electric_surface(mesh=mesh)
 
         if add_reference:
@@ -18,6 +18,7 @@
 
 """Module containing classes for storing electrogram data."""
 
+import copy
 from threading import local
 from attr import attrs, field
 import numpy as np
@@ -281,11 +282,14 @@ class Impedance:
     def copy(self):
         """Create a deep copy of Impedance"""
 
+        # times and values can be lists of arrays of different lengths, which np.array can't copy
         impedance = Impedance(
-            times=np.array(self.times) if self.times is not None else None,
-            values=np.array(self.values) if self.values is not None else None,
+            times=copy.deepcopy(self.times),
+            values=copy.deepcopy(self.values),
         )
 
+        return impedance
+
 
 class ElectricSurface:
     """
@@ -476,7 +480,7 @@ class Electric:
         self._internal_names = internal_names
         self._include = include
         self._is_electrical = is_electrical
-        self._is_electrical_indices = np.nonzero(is_electrical)[0].ravel()
+        self._is_electrical_indices = np.flatnonzero(is_electrical)
         self.bipolar_egm = bipolar_egm
         self.unipolar_egm = unipolar_egm
         self.reference_egm = reference_egm
@@ -601,7 +605,7 @@ class Electric:
         else:
             self._is_electrical = np.hstack([self._is_electrical, is_electrical])
 
-        self._is_electrical_indices = np.nonzero(self._is_electrical)[0].ravel()
+        self._is_electrical_indices = np.flatnonzero(self._is_electrical)
 
         if self._is_landmark is None:
             self._is_landmark = is_landmark
@@ -777,7 +781,8 @@ def extract_electric_data(electric_data):
 
     # We need to know which points are landmark only and have no electrical data.
     # Those that have NaN values for 
-    is_electrical = ~np.all(np.isnan(electric_data['egm'].astype(float)), axis=1)
+    bipolar_egm_data = electric_data['egm'].astype(float)
+    is_electrical = ~np.all(np.isnan(bipolar_egm_data), axis=1)
 
     # Older versions of OpenEP datasets did not have unipolar data or electrode names. Add deafult ones here.
     if 'electrodeNames_bip' not in electric_data:
@@ -849,7 +854,7 @@ def extract_electric_data(electric_data):
 
     # Create objects to pass to Electric
     bipolar_egm = Electrogram(
-        egm=electric_data['egm'].astype(float),
+        egm=bipolar_egm_data,
         points=electric_data['egmX'].astype(float),
         voltage=electric_data['voltages']['bipolar'].astype(float),
         gain=electric_data['egmGain'],
@@ -890,10 +895,12 @@ def extract_electric_data(electric_data):
         values=impedance_values if len(impedance_values) > 0 else None,
     )
 
+    nearest_point = electric_data['egmSurfX']
+    normals = electric_data['barDirection']
     surface = ElectricSurface(
-        nearest_point=electric_data['egmSurfX'].astype(float) if electric_data['egmSurfX'].astype(float).size > 0 else None,
-        normals=electric_data['barDirection'].astype(float) if electric_data['barDirection'].astype(float).size > 0 else None,
-        is_electrical=is_electrical if electric_data['egmSurfX'].size > 0 else None,
+        nearest_point=nearest_point.astype(float) if nearest_point.size > 0 else None,
+        normals=normals.astype(float) if normals.size > 0 else None,
+        is_electrical=is_electrical if nearest_point.size > 0 else None,
     )
 
     # If no sample frequency is specified, assume it's 1000 Hz
@@ -18,13 +18,14 @@
 
 """Module containing classes for storing surface data of a mesh."""
 
+import attr
 from attr import attrs
 import numpy as np
 
 __all__ = []
 
 
-@attrs(auto_attribs=True, auto_detect=True)
+@attrs(auto_attribs=True, auto_detect=True, slots=True)
 class Fields:
     """
     Class for storing information about the surface of a mesh
@@ -53,24 +54,23 @@ class Fields:
     pacing_site: np.ndarray = None
 
     def __repr__(self):
-        return f"fields: {tuple(self.__dict__.keys())}"
+        return f"fields: {_FIELD_NAMES}"
 
     def __getitem__(self, field):
-        try:
-            return self.__dict__[field]
-        except KeyError as e:
-            raise ValueError(f"There is no field '{field}'.") from e
+        if field not in _FIELD_NAMES_SET:
+            raise ValueError(f"There is no field '{field}'.")
+        return getattr(self, field)
 
     def __setitem__(self, field, value):
-        if field not in self.__dict__.keys():
+        if field not in _FIELD_NAMES_SET:
             raise ValueError(f"'{field}' is not a valid field name.")
-        self.__dict__[field] = value
+        setattr(self, field, value)
 
     def __iter__(self):
-        return iter(self.__dict__.keys())
+        return iter(_FIELD_NAMES)
 
     def __contains__(self, field):
-        return field in self.__dict__.keys()
+        return field in _FIELD_NAMES_SET
 
     def copy(self):
         """Create a deep copy of Fields"""
@@ -104,6 +104,11 @@ class Fields:
         return fields
 
 
+# Names of the fields, in the order they are defined
+_FIELD_NAMES = tuple(field.name for field in attr.fields(Fields))
+_FIELD_NAMES_SET = frozenset(_FIELD_NAMES)
+
+
 def extract_surface_data(surface_data):
     """Extract surface data from a dictionary.
 
@@ -122,7 +127,7 @@ def extract_surface_data(surface_data):
         return None, None, Fields()
 
     points = surface_data['triRep']['X'].astype(float)
-    indices = surface_data['triRep']['Triangulation'].astype(int)
+    indices = surface_data['triRep']['Triangulation'].astype(int, copy=False)
 
     if surface_data['act_bip'].size == 0:
         local_activation_time = None
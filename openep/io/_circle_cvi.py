@@ -164,34 +164,92 @@ def get_contours(contour_nodes, dicoms, extract_epi, extract_endo):
     return contour_data, slice_data
 
 
-def _align_contours(contours_xy):
+def pack_contours(contours):
+    """Pack a list of contours into a single array of xy positions.
+
+    Args:
+        contours (list): List of numpy arrays, each containing the xy position of points
+            in a contour.
+
+    Returns:
+        contours_xy (np.ndarray): Array of shape (N, 2) containing the xy positions of the
+            points in every contour, stored contiguously one contour after another.
+        offsets (np.ndarray): Array of size n_contours + 1. The points of contour i are
+            contours_xy[offsets[i]:offsets[i+1]].
+    """
+
+    lengths = np.fromiter((len(contour) for contour in contours), dtype=int, count=len(contours))
+    offsets = np.concatenate([[0], np.cumsum(lengths)])
+
+    if not contours:
+        return np.empty((0, 2), dtype=float), offsets
+
+    contours_xy = np.concatenate(contours, axis=0).astype(float, copy=False)
+
+    return contours_xy, offsets
+
+
+def scale_contours(contours_xy, offsets, dicoms):
+    """Convert contours from (upsampled) pixel coordinates to physical units.
+
+    The contours are scaled in place.
+
+    Args:
+        contours_xy (np.ndarray): Packed xy positions of the contours, as returned by pack_contours.
+        offsets (np.ndarray): Start and end index of each contour in contours_xy. There should be
+            one contour per dicom.
+        dicoms (pandas.DataFrame): DataFrame containing info about the stack of dicoms.
+
+    Returns:
+        contours_xy (np.ndarray): Scaled xy positions of the contours.
+
+    Raises:
+        ValueError: If the number of contours differs from the number of dicoms.
+    """
+
+    n_contours = offsets.size - 1
+    if n_contours != len(dicoms):
+        raise ValueError(
+            f"The number of contours ({n_contours}) must equal the number of dicoms ({len(dicoms)}). "
+            "A slice may contain both a closed and an open contour."
+        )
+
+    scales = dicoms.pixel_spacing_x.to_numpy(dtype=float) / dicoms.upsample_factor.to_numpy(dtype=float)
+    contours_xy *= np.repeat(scales, np.diff(offsets))[:, np.newaxis]
+
+    return contours_xy
+
+
+def _align_contours(contours_xy, offsets):
     """Align a stack of contours so they share the same center of mass.
 
-    contours_xy (list): List of numpy arrays, with each array containing the xy
-        position of points in a contour.
+    The contours are translated in place.
+
+    contours_xy (np.ndarray): Packed xy positions of the contours.
+    offsets (np.ndarray): Start and end index of each contour in contours_xy.
     """
 
-    contour_coms = np.asarray([np.mean(contour, axis=0) for contour in contours_xy])
+    lengths = np.diff(offsets)
+    contour_coms = np.add.reduceat(contours_xy, offsets[:-1], axis=0) / lengths[:, np.newaxis]
     mesh_com = contour_coms[1]  # why use contour_coms[1] as the com, why not e.g. contour_coms[0]?
-    for contour, contour_com in zip(contours_xy, contour_coms):
-        contour += (mesh_com - contour_com)
+    contours_xy += np.repeat(mesh_com - contour_coms, lengths, axis=0)
 
     return contours_xy
 
 
-def _add_z_locations(contours_xy, z_resolution):
-    """Add z values to a list of contours.
+def _add_z_locations(contours_xy, offsets, z_resolution):
+    """Add z values to a stack of contours.
 
     Args:
-        contours_xy (list): List of numpy arrays, each containing contours to which z
+        contours_xy (np.ndarray): Packed xy positions of the contours to which z
             positions be added.
+        offsets (np.ndarray): Start and end index of each contour in contours_xy.
         z_resolution (float): Distance in z between each slice.
     """
 
-    contour_sizes = np.asarray([len(contour) for contour in contours_xy])
-    z_locations = np.asarray([z_resolution * slice_index for slice_index in range(contour_sizes.size)])
-    contour_z = np.concatenate([np.full(size, fill_value=z) for size, z in zip(contour_sizes, z_locations)])
-    contours_xy = np.concatenate(contours_xy, axis=0)
+    lengths = np.diff(offsets)
+    z_locations = z_resolution * np.arange(lengths.size)
+    contour_z = np.repeat(z_locations, lengths)
     contours = np.concatenate([contours_xy, contour_z[:, np.newaxis]], axis=1)
 
     return contours
@@ -240,13 +298,14 @@ def _generate_surface_mesh(contours):
     return surface_mesh
 
 
-def create_mesh(dicoms, contours_xy, align_contours=True, n_apex_slices=0):
+def create_mesh(dicoms, contours_xy, offsets, align_contours=True, n_apex_slices=0):
     """Create a 3D mesh from a set of contours and info about the associated dicoms.
 
     Args:
         dicoms (pandas.DataFrame): DataFrame containing info about the stack of dicoms.
-        contours_xy (list): List of numpy arrays, each containing the xy position of point
-            in a contour.
+        contours_xy (np.ndarray): Packed xy positions of the contours, as returned by
+            pack_contours.
+        offsets (np.ndarray): Start and end index of each contour in contours_xy.
         align_contours (bool, optional): If True, the contours will be translated to share the
             same center of mass in xy.
         n_apex_slices (int, optional): Add an apex to the mesh using this number of slices.
@@ -259,9 +318,9 @@ def create_mesh(dicoms, contours_xy, align_contours=True, n_apex_slices=0):
     z_resolution = np.diff(dicoms.slice_location.values)[0]
 
     if align_contours:
-        contours_xy = _align_contours(contours_xy)
+        contours_xy = _align_contours(contours_xy, offsets)
 
-    contours = _add_z_locations(contours_xy=contours_xy, z_resolution=z_resolution)
+    contours = _add_z_locations(contours_xy=contours_xy, offsets=offsets, z_resolution=z_resolution)
 
     if n_apex_slices:
         contours = _add_apex(contours, n_slices=2)
@@ -53,9 +53,10 @@ and methods of `Case`.
 """
 
 import os
-import scipy.io
+import struct
 
 import numpy as np
+import pandas as pd
 import pyvista
 
 from . import _circle_cvi
@@ -68,25 +69,45 @@ from ..data_structures.case import Case
 __all__ = ["load_openep_mat", "_load_mat", "load_opencarp", "load_circle_cvi", "load_vtk"]
 
 
-def _check_mat_version_73(filename):
-    """Check if a MATLAB file is of version 7.3"""
+def _check_mat_version_73(header):
+    """Check if a MATLAB file is of version 7.3, given the first 128 bytes of the file."""
 
-    byte_stream, file_opened = scipy.io.matlab._mio._open_file(filename, appendmat=False)
-    major_version, minor_version = scipy.io.matlab._miobase.get_matfile_version(byte_stream)
+    # Bytes 124-125 hold the version and 126-127 the endian indicator ('IM' for little-endian)
+    if len(header) < 128:
+        return False
 
-    return major_version == 2
+    byte_order = '<' if header[126:128] == b'IM' else '>'
+    version, = struct.unpack(byte_order + 'H', header[124:126])
+
+    return version == 0x0200
+
+
+def _normalize_notes(notes):
+    """Convert notes loaded from a MATLAB file to an object array of shape (N, 1)."""
+
+    # A single string becomes a 0-d array, which reshape(-1) turns into a 1-element array
+    return np.asarray(notes, dtype=object).reshape(-1)[:, np.newaxis]
 
 
 def _load_mat(filename):
     """Load a MATLAB file."""
 
-    if _check_mat_version_73(filename):
+    with open(filename, 'rb') as f:
+        header = f.read(128)
+
+    if _check_mat_version_73(header):
         data = _load_mat_v73(filename)
     else:
         data = _load_mat_below_v73(filename)
 
-    # These are indices
-    data['surface']['triRep']['Triangulation'] -= 1
+    # These are indices. Convert from MATLAB's 1-based indexing and cast to int in a single pass.
+    triangulation = data['surface']['triRep']['Triangulation']
+    data['surface']['triRep']['Triangulation'] = np.subtract(
+        triangulation,
+        1,
+        out=np.empty(triangulation.shape, dtype=int),
+        casting='unsafe',
+    )
 
     return data
 
@@ -117,14 +138,21 @@ def load_openep_mat(filename, name=None):
     electric = extract_electric_data(data['electric'])
     ablation = extract_ablation_data(data['rf']) if 'rf' in data else None
 
-    if 'notes' in data:
-        notes = np.asarray([data['notes']])[:, np.newaxis] if isinstance(data['notes'], str) else np.asarray(data['notes']).reshape(-1, 1)
-    else:
-        notes = np.asarray([""], dtype=str)[:, np.newaxis]
+    notes = _normalize_notes(data.get('notes', ""))
 
     return Case(name, points, indices, fields, electric, ablation, notes)
 
 
+def _read_opencarp_table(filename, **kwargs):
+    """Read an openCARP .pts or .elem file, using the count in the header to size the table."""
+
+    with open(filename) as f:
+        n_rows = int(f.readline().split()[0])
+        table = pd.read_csv(f, sep=r'\s+', header=None, nrows=n_rows, **kwargs)
+
+    return table.to_numpy()
+
+
 def load_opencarp(
     points,
     indices,
@@ -156,15 +184,18 @@ def load_opencarp(
 
     name = os.path.basename(points) if name is None else name
 
-    points_data = np.loadtxt(points, skiprows=1)
+    points_data = _read_opencarp_table(points, dtype=float)
     points_data *= scale_points
-    indices_data = np.loadtxt(indices, skiprows=1, usecols=[1, 2, 3], dtype=int)
-    cell_region = np.loadtxt(indices, skiprows=1, usecols=4, dtype=int)
+
+    # Read the indices and regions in a single pass. The first column is the element type.
+    elements = _read_opencarp_table(indices, usecols=[1, 2, 3, 4], dtype=int)
+    indices_data = elements[:, :3]
+    cell_region = elements[:, 3]
 
     longitudinal_fibres = None
     transverse_fibres = None
     if fibres is not None:
-        fibres_data = np.loadtxt(fibres, skiprows=1, dtype=float)
+        fibres_data = pd.read_csv(fibres, sep=r'\s+', header=None, skiprows=1, dtype=float).to_numpy()
         longitudinal_fibres = fibres_data[:, :3]
         if fibres_data.shape[1] == 6:
             transverse_fibres = fibres_data[:, 3:]
@@ -198,7 +229,8 @@ def load_vtk(filename, name=None):
     """
 
     name = name if name is not None else os.path.basename(filename)
-    mesh = pyvista.read(filename)
+    # Use the VTK reader for this file type directly rather than going through pyvista.read's dispatch
+    mesh = pyvista.get_reader(filename).read()
 
     case = Case(
         name=name,
@@ -240,28 +272,37 @@ def load_circle_cvi(filename, dicoms_directory, extract_epi=True, extract_endo=T
         extract_endo=extract_endo,
     )
 
+    # Partition the contours into epi and endo in a single pass over the data
+    epi_contours, endo_contours = [], []
+    for contour in contour_data:
+        for key, points in contour.items():
+            if extract_epi and key.startswith('saepicardial'):
+                epi_contours.append(points)
+            elif extract_endo and key.startswith('saendocardial'):
+                endo_contours.append(points)
+
     if extract_epi:
 
-        epi_contours = [contour[key].astype(float) for contour in contour_data for key in contour if 'epi' in key ]
-        for contour_index, (xy_resolution, upsample_factor) in enumerate(zip(dicoms_data.pixel_spacing_x, dicoms_data.upsample_factor)):
-            epi_contours[contour_index] *= xy_resolution / upsample_factor
+        epi_xy, epi_offsets = _circle_cvi.pack_contours(epi_contours)
+        epi_xy = _circle_cvi.scale_contours(epi_xy, epi_offsets, dicoms_data)
 
         epi_mesh = _circle_cvi.create_mesh(
             dicoms=dicoms_data,
-            contours_xy=epi_contours,
+            contours_xy=epi_xy,
+            offsets=epi_offsets,
             align_contours=True,
             n_apex_slices=2,
         )
 
     if extract_endo:
 
-        endo_contours = [contour[key].astype(float) for contour in contour_data for key in contour if 'endo' in key ]
-        for contour_index, (xy_resolution, upsample_factor) in enumerate(zip(dicoms_data.pixel_spacing_x, dicoms_data.upsample_factor)):
-            endo_contours[contour_index] *= xy_resolution / upsample_factor
+        endo_xy, endo_offsets = _circle_cvi.pack_contours(endo_contours)
+        endo_xy = _circle_cvi.scale_contours(endo_xy, endo_offsets, dicoms_data)
 
         endo_mesh = _circle_cvi.create_mesh(
             dicoms=dicoms_data,
-            contours_xy=endo_contours,
+            contours_xy=endo_xy,
+            offsets=endo_offsets,
             align_contours=True,
             n_apex_slices=1,
         )
@@ -157,7 +157,7 @@ def export_openCARP(
     # Ignore all -1 values, as these points do not belong to any pacing site
     for site_index in np.unique(case.fields.pacing_site)[1:]:
         
-        pacing_site_points = np.nonzero(case.fields.pacing_site == site_index)[0]
+        pacing_site_points = np.flatnonzero(case.fields.pacing_site == site_index)
         n_points = pacing_site_points.size
 
         np.savetxt(
@@ -190,28 +190,12 @@ class Boundary:
         if self.n_boundaries == 0:
             return np.array([])
 
-        lengths = [
-            self._line_length(self.points[self.lines[start:stop]]) for
-            start, stop in zip(self._start_indices, self._stop_indices)
-        ]
-
-        return np.asarray(lengths)
-
-    def _line_length(self, points):
-        """
-        Calculates the length of a line defined by the positions of a sequence of points.
-
-        Args:
-            points (ndarray): Nx3 array of cartesian coordinates of points along the line.
-
-        Returns:
-            total_distance (float): length of the line
-        """
-
-        distance_between_neighbours = np.sqrt(np.sum(np.square(points[:, 0, :] - points[:, 1, :]), axis=1))
-        total_distance = np.sum(distance_between_neighbours)
+        # Calculate the length of every line, then sum the lengths within each boundary
+        line_points = self.points[self.lines]
+        line_lengths = np.sqrt(np.sum(np.square(line_points[:, 0, :] - line_points[:, 1, :]), axis=1))
+        lengths = np.add.reduceat(line_lengths, self._start_indices)
 
-        return float(total_distance)
+        return lengths.astype(float)
 
 class FreeBoundary(Boundary):
     """
@@ -555,9 +539,8 @@ def calculate_vertex_path(
 def _get_unreferenced_points(mesh):
     """Determine indices of points not referenced in the triangulation"""
 
-    indices = np.arange(mesh.n_points)
-    referenced_indices = np.unique(mesh.faces.reshape(mesh.n_faces, 4)[:, 1:].ravel())
-    unreferenced_indices = np.isin(indices, referenced_indices, assume_unique=True, invert=True)
+    unreferenced_indices = np.ones(mesh.n_points, dtype=bool)
+    unreferenced_indices[mesh.faces.reshape(mesh.n_faces, 4)[:, 1:].ravel()] = False
 
     return unreferenced_indices
 
@@ -0,0 +1,78 @@
+# OpenEP
+# Copyright (c) 2021 OpenEP Collaborators
+#
+# This file is part of OpenEP.
+#
+# OpenEP is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# OpenEP is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program (LICENSE.txt).  If not, see <http://www.gnu.org/licenses/>
+
+import pytest
+
+import numpy as np
+import pyvista
+
+from openep._datasets.simple_meshes import (
+    CUBE, SPHERE, BROKEN_SPHERE, TRIANGLES
+)
+
+
+@pytest.fixture(scope='session')
+def cube():
+    return pyvista.read(CUBE)
+
+
+@pytest.fixture(scope='session')
+def sphere():
+    return pyvista.read(SPHERE)
+
+
+@pytest.fixture(scope='session')
+def broken_sphere():
+    return pyvista.read(BROKEN_SPHERE)
+
+
+@pytest.fixture(scope='session')
+def triangles():
+    return pyvista.read(TRIANGLES)
+
+
+@pytest.fixture(scope='session')
+def sphere_data(sphere):
+
+    faces = sphere.faces.reshape(-1, 4)[:, 1:]
+    triangles = sphere.points[faces]
+    areas = sphere.compute_cell_sizes(
+            length=False,
+            area=True,
+            volume=False,
+        )['Area']
+
+    # Work on a copy so the 'data' array is not added to the session-scoped sphere
+    point_data = np.arange(sphere.n_points)
+    sphere_copy = sphere.copy()
+    sphere_copy.point_data.set_array(point_data, 'data')
+    cell_data = sphere_copy.point_data_to_cell_data().cell_data['data']
+
+    cell_region = sphere.cell_data['cell_region']
+    unique_regions, region_weights = np.unique(cell_region, return_counts=True)
+
+    return {
+        "faces": faces,
+        "triangles": triangles,
+        "areas": areas,
+        "point_data": point_data,
+        "cell_data": cell_data,
+        "cell_region": cell_region,
+        "unique_regions": unique_regions,
+        "region_weights": region_weights,
+    }
@@ -34,6 +34,7 @@ from openep.case.case_routines import (
     Interpolator,
     interpolate_voltage_onto_surface,
 )
+from openep.case.interpolators import LocalSMoothingInterpolator
 from openep._datasets.openep_datasets import DATASET_2
 
 
@@ -268,6 +269,17 @@ def test_calculate_distance_single_point(mock_case):
     assert (1, 1) == distances.shape
 
 
+def test_calculate_distance_squared(mock_case):
+
+    origin = mock_case.electric.bipolar_egm.points
+    destination = mock_case.points
+
+    distances = calculate_distance(origin, destination)
+    squared_distances = calculate_distance(origin, destination, squared=True)
+
+    assert_allclose(distances ** 2, squared_distances)
+
+
 def test_calculate_points_within_distance(mock_case):
 
     origin = mock_case.electric.bipolar_egm.points
@@ -357,6 +369,32 @@ def test_interpolator_nearest(real_case):
     assert {} == nearest_interpolator.method_kws
 
 
+def test_local_smoothing_interpolator():
+
+    points = np.array([[0, 0, 0], [1, 0, 0], [10, 0, 0]], dtype=float)
+    field = np.array([1, 3, 100], dtype=float)
+    new_points = np.array([[0.5, 0, 0], [20, 0, 0]], dtype=float)
+
+    interpolator = LocalSMoothingInterpolator(points, field, smoothing_length=5)
+    interpolated_field = interpolator(new_points)
+
+    # The first new point is equidistant from the two closest points, and the third point
+    # is beyond the smoothing length. The second new point is too far from all points.
+    assert_allclose(2, interpolated_field[0])
+    assert np.isnan(interpolated_field[1])
+
+
+def test_local_smoothing_interpolator_zero_smoothing_length():
+
+    points = np.array([[0, 0, 0], [1, 0, 0]], dtype=float)
+    field = np.array([1, 3], dtype=float)
+
+    interpolator = LocalSMoothingInterpolator(points, field, smoothing_length=0, fill_value=-1)
+    interpolated_field = interpolator(points)
+
+    assert_allclose([-1, -1], interpolated_field)
+
+
 def test_interpolate_voltage_onto_surface(real_case):
 
     # TODO: these regression tests could be refactored to use a mock data set
@@ -0,0 +1,127 @@
+# OpenEP
+# Copyright (c) 2021 OpenEP Collaborators
+#
+# This file is part of OpenEP.
+#
+# OpenEP is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# OpenEP is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program (LICENSE.txt).  If not, see <http://www.gnu.org/licenses/>
+
+import pytest
+from numpy.testing import assert_allclose, assert_array_equal
+
+import numpy as np
+import pandas as pd
+import pyvista
+
+from openep.io._circle_cvi import (
+    pack_contours,
+    scale_contours,
+    _align_contours,
+    _add_z_locations,
+    create_mesh,
+)
+
+
+@pytest.fixture()
+def contours():
+    rng = np.random.default_rng(0)
+    return [rng.integers(0, 200, size=(n_points, 2)) for n_points in (7, 9, 5, 8)]
+
+
+@pytest.fixture()
+def dicoms():
+    return pd.DataFrame({
+        'pixel_spacing_x': [0.5, 0.7, 1.1, 0.9],
+        'upsample_factor': [2, 4, 1, 3],
+        'slice_location': [0, 8, 16, 24],
+    })
+
+
+@pytest.fixture()
+def scaled_contours(contours, dicoms):
+    """Per-contour reference for scale_contours."""
+
+    scaled_contours = [contour.astype(float) for contour in contours]
+    for contour, xy_resolution, upsample_factor in zip(scaled_contours, dicoms.pixel_spacing_x, dicoms.upsample_factor):
+        contour *= xy_resolution / upsample_factor
+
+    return scaled_contours
+
+
+def test_pack_contours(contours):
+
+    contours_xy, offsets = pack_contours(contours)
+
+    assert contours_xy.dtype == float
+    assert_array_equal([0, 7, 16, 21, 29], offsets)
+    for index, contour in enumerate(contours):
+        assert_array_equal(contour, contours_xy[offsets[index]:offsets[index+1]])
+
+
+def test_scale_contours(contours, dicoms, scaled_contours):
+
+    contours_xy, offsets = pack_contours(contours)
+    contours_xy = scale_contours(contours_xy, offsets, dicoms)
+
+    assert_allclose(np.concatenate(scaled_contours), contours_xy)
+
+
+def test_align_contours(contours, dicoms, scaled_contours):
+
+    contours_xy, offsets = pack_contours(contours)
+    contours_xy = scale_contours(contours_xy, offsets, dicoms)
+    contours_xy = _align_contours(contours_xy, offsets)
+
+    # Every contour is translated to the center of mass of the second contour
+    mesh_com = np.mean(scaled_contours[1], axis=0)
+    expected = [contour + (mesh_com - np.mean(contour, axis=0)) for contour in scaled_contours]
+
+    assert_allclose(np.concatenate(expected), contours_xy)
+    for start, stop in zip(offsets[:-1], offsets[1:]):
+        assert_allclose(mesh_com, contours_xy[start:stop].mean(axis=0))
+
+
+def test_add_z_locations(contours, dicoms, scaled_contours):
+
+    z_resolution = np.diff(dicoms.slice_location.values)[0]
+    contours_xy, offsets = pack_contours(contours)
+    contours_xy = scale_contours(contours_xy, offsets, dicoms)
+    contours_xyz = _add_z_locations(contours_xy, offsets, z_resolution)
+
+    expected_z = np.concatenate([
+        np.full(len(contour), fill_value=z_resolution * slice_index)
+        for slice_index, contour in enumerate(scaled_contours)
+    ])
+
+    assert contours_xyz.shape == (offsets[-1], 3)
+    assert_allclose(np.concatenate(scaled_contours), contours_xyz[:, :2])
+    assert_allclose(expected_z, contours_xyz[:, 2])
+
+
+def test_create_mesh(contours, dicoms):
+
+    contours_xy, offsets = pack_contours(contours)
+    contours_xy = scale_contours(contours_xy, offsets, dicoms)
+    mesh = create_mesh(dicoms, contours_xy, offsets, align_contours=True)
+
+    assert isinstance(mesh, pyvista.PolyData)
+    assert mesh.n_points > 0
+
+
+def test_scale_contours_mismatched_dicoms(contours, dicoms):
+
+    # e.g. a slice containing both a closed and an open contour
+    contours_xy, offsets = pack_contours(contours + [contours[0]])
+
+    with pytest.raises(ValueError, match="number of contours"):
+        scale_contours(contours_xy, offsets, dicoms)
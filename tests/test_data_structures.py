@@ -3,13 +3,14 @@ from numpy.testing import assert_allclose
 
 import numpy as np
 import pyvista
+import scipy.spatial
 
 import openep
 from openep.data_structures.case import Case
 from openep.data_structures.surface import Fields
+from openep.data_structures.ablation import AblationForce
 from openep._datasets.openep_datasets import DATASET_2
 from openep._datasets.meshes import MESH_2_DENSE
-from openep._datasets.simple_meshes import CUBE
 
 
 @pytest.fixture(scope='module')
@@ -23,11 +24,6 @@ def dataset_2_mesh():
     return pyvista.read(MESH_2_DENSE)
 
 
-@pytest.fixture(scope='module')
-def mesh():
-    return pyvista.read(CUBE)
-
-
 @pytest.fixture(scope='module')
 def fields():
 
@@ -42,12 +38,13 @@ def fields():
 
 
 @pytest.fixture(scope='module')
-def case(mesh, fields):
+def case(cube, fields):
 
     name = "Pretend-Case"
 
-    points = mesh.points
-    indices = mesh.faces.reshape(-1, 4)[:, 1:]  # ignore the number of vertices per face
+    # Copy the data so changes to the case do not leak into the session-scoped cube
+    points = np.array(cube.points)
+    indices = cube.faces.reshape(-1, 4)[:, 1:].copy()  # ignore the number of vertices per face
 
     electric = None
     ablation = None
@@ -80,18 +77,53 @@ def test_fields_access_with_key(case):
     assert_allclose(data, case.fields.bipolar_voltage)
 
 
-def test_mesh_creation(mesh, case):
+def test_mesh_creation(cube, case):
 
     mesh_from_case = case.create_mesh()
 
-    assert isinstance(mesh, pyvista.PolyData)
-    assert mesh == mesh_from_case
+    assert isinstance(cube, pyvista.PolyData)
+    assert cube == mesh_from_case
 
 
-def test_mesh_creation_back_faces(mesh, case):
+def test_mesh_creation_back_faces(cube, case):
 
     mesh_from_case = case.create_mesh(back_faces=True)
-    assert mesh.n_faces == mesh_from_case.n_faces / 2
+    assert cube.n_faces == mesh_from_case.n_faces / 2
+
+
+def test_mesh_with_normals_cached(case):
+
+    mesh = case._get_mesh_with_normals()
+    assert 'Normals' in mesh.point_data
+    assert mesh is case._get_mesh_with_normals()
+
+    # The mesh should be reused if the points are replaced by identical values
+    points = case.points
+    case.points = points.copy()
+    assert mesh is case._get_mesh_with_normals()
+
+    # The mesh should be recreated if the points change
+    case.points = points + 1
+    new_mesh = case._get_mesh_with_normals()
+    case.points = points
+
+    assert mesh is not new_mesh
+    assert_allclose(mesh.points + 1, new_mesh.points)
+
+
+def test_mesh_with_normals_in_place_edit(dataset_2):
+
+    case = dataset_2.copy()
+    case.add_landmark("before", "before", case.points[0])
+
+    # Editing the points in-place should invalidate the cached mesh
+    points, _ = case.get_surface_data()
+    points += 10
+    case.add_landmark("after", "after", case.points[0])
+
+    # The nearest surface points must lie on the edited surface
+    distances, _ = scipy.spatial.cKDTree(case.points).query(case.electric.surface.nearest_point)
+    assert_allclose(0, distances)
 
 
 def test_get_surface_data(case):
@@ -143,6 +175,17 @@ def test_no_field(case):
         case.fields[missing_field]
 
 
+def test_impedance_copy(dataset_2):
+
+    impedance = dataset_2.electric.impedance
+    impedance_copy = impedance.copy()
+
+    assert impedance_copy is not impedance
+    assert impedance_copy.times is not impedance.times
+    assert len(impedance.times) == len(impedance_copy.times)
+    assert len(impedance.values) == len(impedance_copy.values)
+
+
 def test_remove_unreferenced_points(dataset_2, dataset_2_mesh):
 
     expected_indices = dataset_2_mesh.faces.reshape(dataset_2_mesh.n_faces, 4)[:, 1:]
@@ -151,3 +194,83 @@ def test_remove_unreferenced_points(dataset_2, dataset_2_mesh):
     assert_allclose(dataset_2_mesh.points, dataset_2.points)
     assert_allclose(expected_indices, dataset_2.indices)
     assert_allclose(dataset_2_mesh.point_data['LAT'], dataset_2.fields.local_activation_time)
+
+
+def test_load_vtk_indices_writeable(dataset_2):
+
+    vtk_case = openep.load_vtk(MESH_2_DENSE)
+
+    # Indices from every loader should support in-place edits
+    assert dataset_2.indices.flags.writeable
+    assert vtk_case.indices.flags.writeable
+
+    vtk_case.indices[0] = vtk_case.indices[0, ::-1]
+
+
+def test_ablation_force():
+
+    times = np.arange(4, dtype=float)
+    points = np.arange(12, dtype=float).reshape(4, 3)
+    ablation_force = AblationForce(
+        times=times,
+        force=times * 2,
+        axial_angle=times * 3,
+        lateral_angle=times * 4,
+        points=points,
+    )
+
+    assert 4 == ablation_force.n_sites
+    assert_allclose(times * 3, ablation_force.axial_angle)
+    assert_allclose(points, ablation_force.points)
+
+    # The copy should not share memory with the original
+    ablation_force_copy = ablation_force.copy()
+    ablation_force_copy.points[:] = 0
+    assert_allclose(points, ablation_force.points)
+
+
+def test_ablation_force_empty():
+
+    ablation_force = AblationForce()
+
+    assert ablation_force.times is None
+    assert ablation_force.points is None
+    assert 0 == ablation_force.n_sites
+    assert ablation_force.copy().points is None
+
+
+def test_ablation_force_missing_data():
+
+    match = "Either all or none of"
+    with pytest.raises(ValueError, match=match):
+        AblationForce(times=np.arange(4, dtype=float))
+
+
+def test_ablation_force_single_site():
+
+    ablation_force = AblationForce(
+        times=1.0,
+        force=2.0,
+        axial_angle=3.0,
+        lateral_angle=4.0,
+        points=np.array([5.0, 6.0, 7.0]),
+    )
+
+    assert 1 == ablation_force.n_sites
+    assert_allclose([[5.0, 6.0, 7.0]], ablation_force.points)
+
+
+def test_ablation_force_transposed_points():
+
+    times = np.arange(4, dtype=float)
+    points = np.arange(12, dtype=float).reshape(3, 4)
+
+    match = r"points must have shape \(4, 3\)"
+    with pytest.raises(ValueError, match=match):
+        AblationForce(
+            times=times,
+            force=times,
+            axial_angle=times,
+            lateral_angle=times,
+            points=points,
+        )
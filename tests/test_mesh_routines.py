@@ -2,7 +2,6 @@ import pytest
 from numpy.testing import assert_allclose
 
 import numpy as np
-import pyvista
 import trimesh
 
 from openep.mesh.mesh_routines import (
@@ -15,59 +14,6 @@ from openep.mesh.mesh_routines import (
     mean_field_per_region,
     low_field_area_per_region,
 )
-from openep._datasets.simple_meshes import (
-    CUBE, SPHERE, BROKEN_SPHERE, TRIANGLES
-)
-
-
-@pytest.fixture(scope='module')
-def cube():
-    return pyvista.read(CUBE)
-
-
-@pytest.fixture(scope='module')
-def sphere():
-    return pyvista.read(SPHERE)
-
-
-@pytest.fixture(scope='module')
-def sphere_data(sphere):
-
-    faces = sphere.faces.reshape(-1, 4)[:, 1:]
-    triangles = sphere.points[faces]
-    areas = sphere.compute_cell_sizes(
-            length=False,
-            area=True,
-            volume=False,
-        )['Area']
-
-    point_data = np.arange(sphere.n_points)
-    sphere.point_data.set_array(point_data, 'data')
-    cell_data = sphere.point_data_to_cell_data().cell_data['data']
-
-    cell_region = sphere.cell_data['cell_region']
-    unique_regions, region_weights = np.unique(cell_region, return_counts=True)
-
-    return {
-        "faces": faces,
-        "triangles": triangles,
-        "areas": areas,
-        "point_data": point_data,
-        "cell_data": cell_data,
-        "cell_region": cell_region,
-        "unique_regions": unique_regions,
-        "region_weights": region_weights,
-    }
-
-
-@pytest.fixture(scope='module')
-def broken_sphere():
-    return pyvista.read(BROKEN_SPHERE)
-
-
-@pytest.fixture(scope='module')
-def triangles():
-    return pyvista.read(TRIANGLES)
 
 
 @pytest.fixture(scope='module')
@@ -88,13 +34,18 @@ def test_create_trimesh(cube):
 
 def test_get_free_boundaries(triangles, free_boundaries):
 
+    # View each xyz triple as a single element so membership can be checked for all points at once
+    row_dtype = np.dtype((np.void, triangles.points.dtype.itemsize * 3))
+    triangle_rows = np.ascontiguousarray(triangles.points).view(row_dtype).ravel()
+    boundary_rows = np.ascontiguousarray(free_boundaries.points, dtype=triangles.points.dtype).view(row_dtype).ravel()
+    is_boundary_point = np.isin(triangle_rows, boundary_rows)
+
     # The first point of the triangles mesh is the centre of a square, and so not on a free boundary
     assert 0 not in free_boundaries.original_lines
-    assert not np.any(np.all(triangles.points[0] == free_boundaries.points, axis=1))
+    assert not is_boundary_point[0]
 
     # All other points are part of free boundaries
-    for point in triangles.points[1:]:
-        assert np.any(np.all(point == free_boundaries.points, axis=1))
+    assert np.all(is_boundary_point[1:])
 
     assert 2 == free_boundaries.n_boundaries
     assert_allclose([5, 4], free_boundaries.n_points_per_boundary)
@@ -242,8 +193,7 @@ def test_mean_field_per_region(sphere, sphere_data):
     )
 
     # Check the weighted mean of the per-region data is equal to the total mean voltage
-    _, weights = np.unique(sphere_data['cell_region'], return_counts=True)
-    weighted_average = np.average(mean_value_per_region, weights=weights)
+    weighted_average = np.average(mean_value_per_region, weights=sphere_data['region_weights'])
 
     assert mean_value_per_region.size == sphere_data['unique_regions'].size
     assert_allclose(np.nanmean(sphere_data['cell_data']), weighted_average, atol=1e-4, rtol=1e-4)
@@ -258,8 +208,7 @@ def test_mean_field_per_region_cell_data(sphere, sphere_data):
     )
 
     # Check the weighted mean of the per-region data is equal to the total mean voltage
-    _, weights = np.unique(sphere_data['cell_region'], return_counts=True)
-    weighted_average = np.average(mean_value_per_region, weights=weights)
+    weighted_average = np.average(mean_value_per_region, weights=sphere_data['region_weights'])
 
     assert mean_value_per_region.size == sphere_data['unique_regions'].size
     assert_allclose(np.nanmean(sphere_data['cell_data']), weighted_average, atol=1e-4, rtol=1e-4)
@@ -25,11 +25,17 @@ import openep
 from openep._datasets.openep_datasets import DATASET_2
 
 
-@pytest.fixture()
-def case():
+@pytest.fixture(scope='module')
+def loaded_case():
     return openep.load_openep_mat(DATASET_2)
 
 
+@pytest.fixture()
+def case(loaded_case):
+    # Exporting adds missing fields to the case, so give each test its own copy
+    return loaded_case.copy()
+
+
 @pytest.fixture()
 def exported_case(case, tmp_path):
 
@@ -97,3 +103,22 @@ def test_openep_mat_export(case, exported_case):
     assert_allclose(case.ablation.force.force, exported_case.ablation.force.force)
     assert_allclose(case.ablation.force.axial_angle, exported_case.ablation.force.axial_angle)
     assert_allclose(case.ablation.force.lateral_angle, exported_case.ablation.force.lateral_angle)
+
+
+def test_openCARP_export(case, tmp_path):
+    """Check the mesh data are unchanged after exporting to and loading from openCARP format."""
+
+    prefix = tmp_path / "exported_case"
+    openep.export_openCARP(case, prefix.as_posix())
+
+    exported_case = openep.load_opencarp(
+        points=prefix.with_suffix('.pts').as_posix(),
+        indices=prefix.with_suffix('.elem').as_posix(),
+        fibres=prefix.with_suffix('.lon').as_posix(),
+    )
+
+    assert_allclose(case.points, exported_case.points, atol=1e-6)
+    assert_allclose(case.indices, exported_case.indices)
+    assert_allclose(0, exported_case.fields.cell_region)
+    assert_allclose([1, 0, 0], exported_case.fields.longitudinal_fibres[0])
+    assert_allclose([1, 0, 0], exported_case.fields.transverse_fibres[0])